@@ -5,7 +5,20 @@
 Pocketutils.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
+from pocketutils import core as _core
 from pocketutils.core import *
+from pocketutils.core import chars as _chars
+from pocketutils.core import decorators as _decorators
+from pocketutils.core import dot_dict as _dot_dict
+from pocketutils.core import enums as _enums
+from pocketutils.core import exceptions as _exceptions
+from pocketutils.core import frozen_types as _frozen_types
+from pocketutils.core import input_output as _input_output
+from pocketutils.core import iterators as _iterators
+from pocketutils.core import smartio as _smartio
 from pocketutils.core.chars import *
 from pocketutils.core.decorators import *
 from pocketutils.core.dot_dict import *
@@ -15,39 +28,175 @@ from pocketutils.core.frozen_types import *
 from pocketutils.core.input_output import *
 from pocketutils.core.iterators import *
 from pocketutils.core.smartio import *
-from pocketutils.tools.call_tools import *
-from pocketutils.tools.common_tools import *
-from pocketutils.tools.console_tools import *
-from pocketutils.tools.filesys_tools import *
-from pocketutils.tools.git_tools import *
-from pocketutils.tools.io_tools import *
-from pocketutils.tools.json_tools import JsonUtils
-from pocketutils.tools.numeric_tools import *
-from pocketutils.tools.path_tools import *
-from pocketutils.tools.reflection_tools import *
-from pocketutils.tools.string_tools import *
-from pocketutils.tools.sys_tools import *
-from pocketutils.tools.unit_tools import *
-
-
-class Utils(
-    CallUtils,
-    CommonUtils,
-    ConsoleUtils,
-    FilesysUtils,
-    IoUtils,
-    JsonUtils,
-    NumericUtils,
-    PathUtils,
-    GitUtils,
-    ReflectionUtils,
-    StringUtils,
-    SystemUtils,
-    UnitUtils,
-):
+
+# the tool modules pull in heavier dependencies (regex, orjson, ...),
+# so they are only imported on first access (PEP 562)
+_LAZY = {
+    name: f"pocketutils.tools.{module}"
+    for module, names in {
+        "call_tools": ["CallUtils", "CallTools"],
+        "common_tools": ["CommonUtils", "CommonTools"],
+        "console_tools": ["ConsoleUtils", "ConsoleTools"],
+        "filesys_tools": ["FilesysUtils", "FilesysTools", "PathInfo"],
+        "git_tools": ["GitDescription", "GitUtils", "GitTools"],
+        "io_tools": ["IoUtils", "IoTools"],
+        "json_tools": ["JsonUtils"],
+        "numeric_tools": ["NumericUtils", "NumericTools"],
+        "path_tools": ["PathUtils", "PathTools"],
+        "reflection_tools": ["ReflectionUtils", "ReflectionTools"],
+        "string_tools": ["StringUtils", "StringTools"],
+        "sys_tools": ["Frame", "SerializedException", "SignalHandler", "ExitHandler", "SystemUtils", "SystemTools"],
+        "unit_tools": ["UnitUtils", "UnitTools"],
+    }.items()
+    for name in names
+}
+
+_UTILS_MIXINS = [
+    "CallUtils",
+    "CommonUtils",
+    "ConsoleUtils",
+    "FilesysUtils",
+    "IoUtils",
+    "JsonUtils",
+    "NumericUtils",
+    "PathUtils",
+    "GitUtils",
+    "ReflectionUtils",
+    "StringUtils",
+    "SystemUtils",
+    "UnitUtils",
+]
+
+if TYPE_CHECKING:
+    # static view of the API; at runtime, these are loaded by `__getattr__` and Utils is built by `_new_utils`
+    from pocketutils.tools.call_tools import CallTools, CallUtils
+    from pocketutils.tools.common_tools import CommonTools, CommonUtils
+    from pocketutils.tools.console_tools import ConsoleTools, ConsoleUtils
+    from pocketutils.tools.filesys_tools import FilesysTools, FilesysUtils, PathInfo
+    from pocketutils.tools.git_tools import GitDescription, GitTools, GitUtils
+    from pocketutils.tools.io_tools import IoTools, IoUtils
+    from pocketutils.tools.json_tools import JsonUtils
+    from pocketutils.tools.numeric_tools import NumericTools, NumericUtils
+    from pocketutils.tools.path_tools import PathTools, PathUtils
+    from pocketutils.tools.reflection_tools import ReflectionTools, ReflectionUtils
+    from pocketutils.tools.string_tools import StringTools, StringUtils
+    from pocketutils.tools.sys_tools import (
+        ExitHandler,
+        Frame,
+        SerializedException,
+        SignalHandler,
+        SystemTools,
+        SystemUtils,
+    )
+    from pocketutils.tools.unit_tools import UnitTools, UnitUtils
+
+    class Utils(
+        CallUtils,
+        CommonUtils,
+        ConsoleUtils,
+        FilesysUtils,
+        IoUtils,
+        JsonUtils,
+        NumericUtils,
+        PathUtils,
+        GitUtils,
+        ReflectionUtils,
+        StringUtils,
+        SystemUtils,
+        UnitUtils,
+    ):
+        """
+        A collection of utility methods.
+        """
+
+    Tools: Utils
+
+__all__ = [
+    "CallTools",
+    "CallUtils",
+    "CommonTools",
+    "CommonUtils",
+    "ConsoleTools",
+    "ConsoleUtils",
+    "ExitHandler",
+    "FilesysTools",
+    "FilesysUtils",
+    "Frame",
+    "GitDescription",
+    "GitTools",
+    "GitUtils",
+    "IoTools",
+    "IoUtils",
+    "JsonUtils",
+    "NumericTools",
+    "NumericUtils",
+    "PathInfo",
+    "PathTools",
+    "PathUtils",
+    "ReflectionTools",
+    "ReflectionUtils",
+    "SerializedException",
+    "SignalHandler",
+    "StringTools",
+    "StringUtils",
+    "SystemTools",
+    "SystemUtils",
+    "Tools",
+    "UnitTools",
+    "UnitUtils",
+    "Utils",
+]
+__all__ += _core.__all__
+__all__ += _chars.__all__
+__all__ += _decorators.__all__
+__all__ += _dot_dict.__all__
+__all__ += _enums.__all__
+__all__ += _exceptions.__all__
+__all__ += _frozen_types.__all__
+__all__ += _input_output.__all__
+__all__ += _iterators.__all__
+__all__ += _smartio.__all__
+
+
+def _flatten(*mixins: type) -> dict[str, object]:
     """
-    A collection of utility methods.
+    Merges the class attributes of `mixins` into one namespace, skipping dunders.
+    Earlier mixins take precedence, matching the MRO of `class X(*mixins)`.
     """
+    namespace = {}
+    for mixin in reversed(mixins):
+        namespace |= {k: v for k, v in vars(mixin).items() if not k.startswith("__")}
+    return namespace
+
+
+def _new_utils() -> type:
+    # keep the real bases for isinstance, but copy their attributes up so each lookup is one dict hit
+    mixins = [__getattr__(name) for name in _UTILS_MIXINS]
+    return type(
+        "Utils",
+        tuple(mixins),
+        {
+            "__doc__": "A collection of utility methods.",
+            "__module__": __name__,
+            "__slots__": (),
+            **_flatten(*mixins),
+        },
+    )
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+    elif name == "Utils":
+        value = _new_utils()
+    elif name == "Tools":
+        value = __getattr__("Utils")()
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
 
 
-Tools = Utils()
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | __all__)
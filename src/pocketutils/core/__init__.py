@@ -21,10 +21,6 @@ T_co = TypeVar("T_co", covariant=True)
 logger = logging.getLogger("pocketutils")
 
 
-def null_context():
-    yield
-
-
 class Sentinel:
     """
     A sentinel value tied to nothing more than a memory address.
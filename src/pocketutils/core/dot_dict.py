@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import abc
+import importlib.util
 import io
 import json
 import pickle
@@ -18,7 +19,7 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING, Any, Self, TypeVar, Unpack
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping, MutableMapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
 
 _Single = None | str | int | float | date | datetime
 TomlLeaf = list[_Single] | _Single
@@ -192,13 +193,9 @@ class TomlkitTomlMixin(AbstractTomlMixin):
 class BuiltinJsonMixin(AbstractJsonMixin):
     @classmethod
     def from_json(cls: type[Self], data: str) -> Self:
-        import json
-
         return cls(json.loads(data))
 
     def to_json(self: Self) -> str:
-        import json
-
         return json.dumps(self, ensure_ascii=False)
 
 
@@ -277,11 +274,8 @@ class AbstractDotDict(dict[str, TomlLeaf | TomlBranch]):
         return self.__class__(x)
 
     def walk(self: Self) -> Iterable[TomlLeaf | TomlBranch]:
-        for value in self.values():
-            if isinstance(value, dict):
-                yield from self.__class__(value).walk()
-            else:
-                yield value
+        for _, value in self._iter_leaves():
+            yield value
 
     def nodes(self: Self) -> dict[str, TomlBranch | TomlLeaf]:
         return {**self.branches(), **self.leaves()}
@@ -309,13 +303,21 @@ class AbstractDotDict(dict[str, TomlLeaf | TomlBranch]):
         Returns:
             `dotted-key:str -> value`
         """
-        dct = {}
-        for key, value in self.items():
-            if isinstance(value, dict):
-                dct.update({key + "." + k: v for k, v in self.__class__(value).leaves().items()})
+        return dict(self._iter_leaves())
+
+    def _iter_leaves(self: Self) -> Iterator[tuple[str, TomlLeaf]]:
+        # depth-first with an explicit stack of (prefix, items iterator),
+        # so sub-dicts are neither wrapped (re-checked) nor recursed into
+        stack = [("", iter(self.items()))]
+        while len(stack) > 0:
+            prefix, it = stack[-1]
+            for key, value in it:
+                if isinstance(value, dict):
+                    stack.append((prefix + key + ".", iter(value.items())))
+                    break
+                yield prefix + key, value
             else:
-                dct[key] = value
-        return dct
+                stack.pop()
 
     def sub(self: Self, items: str) -> Self:
         """
@@ -379,25 +381,22 @@ class AbstractDotDict(dict[str, TomlLeaf | TomlBranch]):
             x = self[items]
         except KeyError:
             return [] if default is None else default
-        if not isinstance(x, list) or isinstance(x, str):
-            msg = f"Value {x} is not a list for lookup {items}"
-            raise TypeError(msg)
-        bad = [y for y in x if not isinstance(y, as_type)]
-        if len(bad) > 0:
-            msg = f"Value(s) from {items} are not {as_type}: {bad}"
-            raise TypeError(msg)
-        return x
+        return self._check_list(items, x, as_type)
 
     def req_list_as(self: Self, items: str, as_type: type[T]) -> list[T]:
         """
         Gets list values from a *required* key.
         """
-        x = self[items]
-        if not isinstance(x, list) or isinstance(x, str):
+        return self._check_list(items, self[items], as_type)
+
+    def _check_list(self: Self, items: str, x: TomlLeaf | TomlBranch, as_type: type[T]) -> list[T]:
+        if not isinstance(x, list):
             msg = f"Value {x} is not a list for lookup {items}"
             raise TypeError(msg)
+        # all() stops at the first mismatch; only collect the bad values when reporting
         if not all(isinstance(y, as_type) for y in x):
-            msg = f"Value {x} from {items} is a {type(x)}, not {as_type}"
+            bad = [y for y in x if not isinstance(y, as_type)]
+            msg = f"Value(s) from {items} are not {as_type}: {bad}"
             raise TypeError(msg)
         return x
 
@@ -423,14 +422,19 @@ class AbstractDotDict(dict[str, TomlLeaf | TomlBranch]):
             d = WrappedToml(dict(a=dict(b=1)))
             assert d["a.b"] == 1
         """
-        if "." in items:
-            i0, _, i_ = items.partition(".")
-            z = self[i0]
-            if not isinstance(z, dict | AbstractDotDict):
-                msg = f"No key {items} (ends at {i0})"
+        if "." not in items:
+            return super().__getitem__(items)
+        # walk the plain dicts directly rather than wrapping (and re-checking) each level
+        first, *rest = items.split(".")
+        z = super().__getitem__(first)
+        at = first
+        for key in rest:
+            if not isinstance(z, dict):
+                msg = f"No key {items} (ends at {at})"
                 raise KeyError(msg)
-            return self.__class__(z)[i_]
-        return super().__getitem__(items)
+            z = z[key]
+            at = key
+        return z
 
     def __rich_repr__(self: Self) -> str:
         """
@@ -465,26 +469,10 @@ class AbstractDotDict(dict[str, TomlLeaf | TomlBranch]):
             raise TypeError(msg)
 
 
-try:
-    import orjson
-
-    _Json = OrjsonJsonMixin
-except ImportError:
-    _Json = BuiltinJsonMixin
-
-try:
-    import orjson
-
-    _Toml = TomlkitTomlMixin
-except ImportError:
-    _Toml = TomllibTomlMixin
-
-try:
-    import ruamel
-
-    _Yaml = RuamelYamlMixin
-except ImportError:
-    _Yaml = None
+# find_spec checks availability without importing; the mixins import lazily on first use
+_Json = OrjsonJsonMixin if importlib.util.find_spec("orjson") else BuiltinJsonMixin
+_Toml = TomlkitTomlMixin if importlib.util.find_spec("tomlkit") else TomllibTomlMixin
+_Yaml = RuamelYamlMixin if importlib.util.find_spec("ruamel") else None
 
 if _Yaml is None:
 
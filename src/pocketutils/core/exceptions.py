@@ -561,3 +561,61 @@ class HashIncorrectError(Error):
         self.filename = filename
         self.actual = actual
         self.expected = expected
+
+
+__all__ = [
+    "AccessDeniedError",
+    "AlgorithmError",
+    "AuthenticationError",
+    "AuthorizationError",
+    "DeviceConnectionFailedError",
+    "DeviceError",
+    "DeviceMissingError",
+    "DeviceReadFailedError",
+    "DeviceWriteFailedError",
+    "DownloadFailedError",
+    "Error",
+    "ExpectedError",
+    "FilenameSuffixInvalidError",
+    "HashFailedError",
+    "HashIncorrectError",
+    "InsecureWarning",
+    "KeyReservedError",
+    "KeyReusedError",
+    "LengthMismatchError",
+    "MultipleMatchesError",
+    "NetworkError",
+    "NoMatchesError",
+    "OperationNotSupportedError",
+    "PathExistsError",
+    "PathMissingError",
+    "ReadFailedError",
+    "RequestAmbiguousError",
+    "RequestContradictoryError",
+    "RequestError",
+    "RequestIgnoredError",
+    "RequestRefusedError",
+    "RequestStrangeWarning",
+    "ResourceError",
+    "ResourceIncompleteError",
+    "ResourceInvalidError",
+    "ResourceLockedError",
+    "ResourceMissingError",
+    "ResultStrangeWarning",
+    "SecurityError",
+    "StateIllegalError",
+    "TypedIOError",
+    "TypedIsADirectoryError",
+    "TypedNotADirectoryError",
+    "TypedOSError",
+    "UploadFailedError",
+    "UserError",
+    "ValueEmptyError",
+    "ValueIllegalError",
+    "ValueNotIntegerError",
+    "ValueNotNumericError",
+    "ValueNotUniqueError",
+    "ValueNullError",
+    "ValueOutOfRangeError",
+    "WriteFailedError",
+]
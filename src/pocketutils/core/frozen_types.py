@@ -237,6 +237,7 @@ class FrozeSet(frozenset[T_co], Hashable):
         raise TypeError(msg)
 
 
+@functools.total_ordering
 class FrozeDict(Mapping[K_contra, V_co], Hashable):
     """
     An immutable dictionary/mapping.
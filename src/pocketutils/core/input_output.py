@@ -10,12 +10,13 @@ from __future__ import annotations
 import abc
 import contextlib
 import functools
+import io
 import logging
 from dataclasses import dataclass
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar, final
 
-from pocketutils import ValueIllegalError
+from pocketutils.core.exceptions import ValueIllegalError
 
 if TYPE_CHECKING:
     from io import StringIO
@@ -74,8 +75,14 @@ class LogWriter(Writeable[str]):
 
     def __init__(self: Self, level: int | str) -> None:
         if isinstance(level, str):
-            level = level.upper()
-        self.level = logging.getLevelName(level)
+            name = level
+            level = logging.getLevelName(name.upper())
+            if not isinstance(level, int):
+                msg = f"Unknown log level {name}"
+                raise ValueIllegalError(msg, value=name)
+        self.level = level
+        # bind once so that write() is a single call per message
+        self._log = functools.partial(logger.log, level)
 
     def __enter__(self: Self) -> Self:
         return self
@@ -84,7 +91,7 @@ class LogWriter(Writeable[str]):
         self.close()
 
     def write(self: Self, msg: str) -> int:
-        getattr(logger, self.level)(msg)
+        self._log(msg)
         return len(msg)
 
     def flush(self: Self) -> None:
@@ -130,7 +137,12 @@ class Capture:
     cio: StringIO
 
     def __len__(self: Self) -> int:
-        return len(repr(self))
+        # the end offset of a StringIO is its length in characters; avoids copying the buffer
+        pos = self.cio.tell()
+        try:
+            return self.cio.seek(0, io.SEEK_END)
+        finally:
+            self.cio.seek(pos)
 
     def __str__(self: Self) -> str:
         return self.cio.getvalue()
@@ -140,7 +152,11 @@ class Capture:
 
     @property
     def lines(self: Self) -> list[str]:
-        return self.split("\n")
+        """
+        Returns the lines, as `str.splitlines` does.
+        No empty last element is added for a trailing newline, and `\\r`, `\\r\\n`, and other line boundaries split too.
+        """
+        return self.cio.getvalue().splitlines()
 
     @property
     def value(self: Self) -> str:
@@ -226,10 +242,6 @@ class OpenMode(str):
         return self.__class__(s)
 
 
-def null_context():
-    yield
-
-
 def return_none_1_param(a: Any) -> None:
     return None
 
@@ -244,8 +256,8 @@ def return_none_3_params(a: Any, b: Any, c: Any) -> None:
 
 @contextlib.contextmanager
 def silenced(no_stdout: bool = True, no_stderr: bool = True):
-    with contextlib.redirect_stdout(DevNull()) if no_stdout else null_context():
-        with contextlib.redirect_stderr(DevNull()) if no_stderr else null_context():
+    with contextlib.redirect_stdout(DevNull()) if no_stdout else contextlib.nullcontext():
+        with contextlib.redirect_stderr(DevNull()) if no_stderr else contextlib.nullcontext():
             yield
 
 
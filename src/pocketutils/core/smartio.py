@@ -12,6 +12,7 @@ import bz2
 import gzip
 import lzma
 import os
+import stat
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path, PurePath
@@ -43,10 +44,8 @@ class Compression:
 
     def split_path(self: Self, path: PurePath | str) -> CompressedPath:
         path = Path(path)
-        for suffix in self.suffixes:
-            if path.suffix == suffix:
-                return CompressedPath(path.parent, path.stem, suffix)
-        return CompressedPath(path.parent, path.stem, "")
+        suffix = path.suffix
+        return CompressedPath(path.parent, path.stem, suffix if suffix in self.suffixes else "")
 
     def compress_file(self: Self, source: PurePath | str, dest: PurePath | str, atomic: bool = False) -> None:
         source = Path(source)
@@ -79,13 +78,26 @@ class CompressionSet:
     def empty(cls: type[Self]) -> Self:
         return CompressionSet({"": Compression("", [], identity, identity)})
 
+    @classmethod
+    def _build(cls: type[Self], formats: Iterable[Compression], base: Mapping[str, Compression] | None = None) -> Self:
+        """
+        Builds a set from `formats` in one pass, starting from `base` (if given).
+        Unlike chaining `+`, only one dict is allocated.
+
+        Raises:
+            KeyReusedError: If a name or suffix is already mapped to a different `Compression`
+        """
+        mapping = {} if base is None else dict(base)
+        for fmt in formats:
+            for key in [fmt.name, *fmt.suffixes]:
+                already = mapping.setdefault(key, fmt)
+                if already is not fmt and already != fmt:
+                    msg = f"Key {key} from {fmt} already mapped to {already}"
+                    raise KeyReusedError(msg, key=key, original_value=already)
+        return cls(mapping)
+
     def __add__(self: Self, fmt: Compression):
-        new = {fmt.name: fmt} | {s: fmt for s in fmt.suffixes}
-        already = {v for k, v in self.mapping.items() if k in new}
-        if len(already) > 1 or len(already) == 1 and already != {fmt}:
-            msg = f"Keys from {fmt} already mapped to {already}"
-            raise KeyReusedError(msg, key=fmt.name, original_value=already)
-        return CompressionSet(self.mapping | new)
+        return self._build([fmt], self.mapping)
 
     def __sub__(self: Self, fmt: Compression) -> CompressionSet:
         return CompressionSet(
@@ -109,12 +121,9 @@ class CompressionSet:
         return self.mapping[t]
 
     def guess(self: Self, path: PathLike) -> Compression:
-        if "." not in path.name:
-            return self[""]
-        try:
-            return self[path.suffix]
-        except KeyError:
-            return self[""]
+        # no suffix ("") maps to the identity compression
+        fmt = self.mapping.get(PurePath(path).suffix)
+        return self[""] if fmt is None else fmt
 
 
 @dataclass(frozen=True, slots=True)
@@ -128,13 +137,14 @@ class AbstractSmartIo(metaclass=abc.ABCMeta):
     @property
     def compressions(self: Self) -> CompressionSet:
         if self._compressions is None:
-            self._compressions = self._new_compression_list()
+            # frozen, so bypass __setattr__
+            object.__setattr__(self, "_compressions", self._new_compression_list())
         return self._compressions
 
     @property
     def all_suffixes(self: Self) -> Iterable[str]:
-        for c in self.compressions:
-            yield from c.suffixes
+        # every suffix is a key of the mapping (names never start with '.')
+        return [k for k in self.mapping if k.startswith(".")]
 
     def _new_compression_list(self: Self) -> CompressionSet:
         raise NotImplementedError()
@@ -150,18 +160,20 @@ class AbstractSmartIo(metaclass=abc.ABCMeta):
     ) -> None:
         path = Path(path)
         compressed = self.compressions.guess(path).compress(data)
-        if path.exists() and not path.is_file():
-            raise PathExistsError(filename=str(path))
-        if path.exists() and not exist_ok:
+        try:
+            info = path.stat()
+        except FileNotFoundError:
+            info = None
+        if info is not None and (not stat.S_ISREG(info.st_mode) or not exist_ok):
             raise PathExistsError(filename=str(path))
-        if path.exists() and not os.access(path, os.W_OK):
+        if info is not None and not os.access(path, os.W_OK):
             raise AccessDeniedError(filename=str(path))
         if mkdirs:
             path.parent.mkdir(parents=True, exist_ok=True)
         if atomic:
             tmp = self.tmp_path(path)
-            path.write_bytes(compressed)
-            tmp.rename(path)
+            tmp.write_bytes(compressed)
+            tmp.replace(path)
         else:
             path.write_bytes(compressed)
 
@@ -179,8 +191,7 @@ class AbstractSmartIo(metaclass=abc.ABCMeta):
         return self.compressions.guess(path).decompress(data)
 
     def tmp_path(self: Self, path: PathLike, extra: str = "tmp") -> Path:
-        now = datetime.now(tz=UTC).isoformat(timespec="microsecond")
-        now = now.replace(":", "").replace("-", "")
+        now = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%S.%f%z")
         path = Path(path)
         suffix = "".join(path.suffixes)
         return path.parent / f".part_{extra}.{now}{suffix}"
@@ -194,16 +205,18 @@ class SmartIoUtil(AbstractSmartIo, metaclass=abc.ABCMeta):
         import snappy
         import zstandard
 
-        return (
-            CompressionSet.empty()
-            + Compression("gzip", [".gz", ".gzip"], gzip.compress, gzip.decompress)
-            + Compression("brotli", [".br", ".brotli"], brotli.compress, brotli.decompress)
-            + Compression("zstandard", [".zst", ".zstd"], zstandard.compress, zstandard.decompress)
-            + Compression("lz4", [".lz4"], lz4.frame.compress, lz4.frame.decompress)
-            + Compression("snappy", [".snappy"], snappy.compress, snappy.decompress)
-            + Compression("bzip2", [".bz2", ".bzip2"], bz2.compress, bz2.decompress)
-            + Compression("xz", [".xz"], lzma.compress, lzma.decompress)
-            + Compression("lzma", [".lzma"], lzma.compress, lzma.decompress)
+        return CompressionSet._build(
+            [
+                Compression("gzip", [".gz", ".gzip"], gzip.compress, gzip.decompress),
+                Compression("brotli", [".br", ".brotli"], brotli.compress, brotli.decompress),
+                Compression("zstandard", [".zst", ".zstd"], zstandard.compress, zstandard.decompress),
+                Compression("lz4", [".lz4"], lz4.frame.compress, lz4.frame.decompress),
+                Compression("snappy", [".snappy"], snappy.compress, snappy.decompress),
+                Compression("bzip2", [".bz2", ".bzip2"], bz2.compress, bz2.decompress),
+                Compression("xz", [".xz"], lzma.compress, lzma.decompress),
+                Compression("lzma", [".lzma"], lzma.compress, lzma.decompress),
+            ],
+            CompressionSet.empty().mapping,
         )
 
 
@@ -4,12 +4,13 @@
 
 import contextlib
 import logging
+import os
+import selectors
 import subprocess  # noqa: S404
 from collections.abc import Callable, Generator, Mapping, Sequence
-from copy import copy
 from dataclasses import dataclass
 from pathlib import PurePath
-from queue import Queue
+from queue import Empty, Queue
 from subprocess import CalledProcessError, CompletedProcess
 from threading import Thread
 from typing import IO, Any, AnyStr, Self, Unpack
@@ -19,11 +20,13 @@ from pocketutils.core.input_output import DevNull
 __all__ = ["CallUtils", "CallTools"]
 
 logger = logging.getLogger("pocketutils")
-
-
-@contextlib.contextmanager
-def null_context():
-    yield
+_LOG_PREFIXES = (
+    (b"FATAL:", "critical"),
+    (b"ERROR:", "error"),
+    (b"WARNING:", "warning"),
+    (b"INFO:", "info"),
+    (b"DEBUG:", "debug"),
+)
 
 
 @dataclass(slots=True, frozen=True)
@@ -34,9 +37,9 @@ class CallUtils:
         Context manager that suppresses stdout and stderr.
         """
         # noinspection PyTypeChecker
-        with contextlib.redirect_stdout(DevNull()) if no_stdout else null_context():
+        with contextlib.redirect_stdout(DevNull()) if no_stdout else contextlib.nullcontext():
             # noinspection PyTypeChecker
-            with contextlib.redirect_stderr(DevNull()) if no_stderr else null_context():
+            with contextlib.redirect_stderr(DevNull()) if no_stderr else contextlib.nullcontext():
                 yield
 
     def call_cmd_utf(
@@ -55,19 +58,11 @@ class CallUtils:
         See Also:
             `subprocess.check_output`, which only returns stdout
         """
+        cmd = [str(c) for c in cmd]
         log_fn("Calling '{}'".format(" ".join(cmd)))
-        kwargs = copy(kwargs)
-        if "cwd" in kwargs and isinstance(kwargs["path"], PurePath):
+        if isinstance(kwargs.get("cwd"), PurePath):
             kwargs["cwd"] = str(kwargs["cwd"])
-        calling = dict(
-            *[str(c) for c in cmd],
-            capture_output=True,
-            check=True,
-            text=True,
-            encoding="utf-8",
-            **kwargs,
-        )
-        x = subprocess.run(**calling)  # noqa: S603,S607
+        x = subprocess.run(cmd, capture_output=True, check=True, encoding="utf-8", **kwargs)  # noqa: S603
         log_fn(f"stdout: '{x.stdout}'")
         log_fn(f"stderr: '{x.stderr}'")
         x.stdout = x.stdout.strip()
@@ -82,7 +77,7 @@ class CallUtils:
             e: The error
             log_fn: For example, `logger.warning`
         """
-        log_fn(f'Failed on command: {" ".join(e.cmd)}')
+        log_fn(f"Failed on command: {' '.join(e.cmd)}")
         out = None
         if e.stdout is not None:
             out = e.stdout.decode(encoding="utf-8") if isinstance(e.stdout, bytes) else e.stdout
@@ -101,7 +96,8 @@ class CallUtils:
         **kwargs: Unpack[Mapping[str, Any]],
     ) -> None:
         """
-        Processes stdout and stderr on separate threads.
+        Processes stdout and stderr as lines arrive, multiplexing both pipes with `selectors`
+        (or on separate threads on Windows).
         Streamed -- can avoid filling a stdout or stderr buffer.
         Calls an external command, waits, and throws a
         ExternalCommandFailed for nonzero exit codes.
@@ -110,7 +106,8 @@ class CallUtils:
             cmd: The command args
             callback: A function that processes (is_stderr, piped line).
                       If `None`, uses :meth:`smart_log`.
-            timeout_secs: Max seconds to wait for the next line
+            timeout_secs: Max seconds to wait while the command produces no output on either pipe,
+                          and then for it to exit once both pipes have closed
             kwargs: Passed to `subprocess.Popen`; do not pass `stdout` or `stderr`.
 
         Raises:
@@ -123,12 +120,11 @@ class CallUtils:
         calling = dict(stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
         p = subprocess.Popen(cmd, **calling)  # noqa: S603,S607
         try:
-            q = Queue()
-            Thread(target=self._reader, args=[False, p.stdout, q]).start()
-            Thread(target=self._reader, args=[True, p.stderr, q]).start()
-            for _ in range(2):
-                for source, line in iter(q.get, None):
-                    callback(source, line)
+            if os.name == "nt":
+                # select() only accepts sockets on Windows
+                self._stream_threaded(p, callback, timeout_secs)
+            else:
+                self._stream_selected(p, callback, timeout_secs)
             exit_code = p.wait(timeout=timeout_secs)
         finally:
             p.kill()
@@ -146,31 +142,81 @@ class CallUtils:
         """
         Maps (is_stderr, piped line) pairs to logging statements.
         The data must be utf-8-encoded.
-        If the line starts with `warning:` (case-insensitive), uses `log.warning`.
-        The same is true for any other method attached to `log`.
+        If the line starts with `warning:` (case-insensitive), strips that and uses `log.warning`.
+        The same is true for `fatal:`, `error:`, `info:`, and `debug:`.
         Falls back to DEBUG if no valid prefix is found.
         This is useful if you wrote an external application (e.g. in C)
         and want those logging statements mapped into your calling Python code.
         """
-        line = line.decode("utf-8")
-        try:
-            fn = getattr(log, line.split(":")[0].lower())
-        except AttributeError:
-            fn = log.debug
+        # match on the raw bytes so that the line is decoded (and logged) exactly once
+        head = line[:9].upper()
+        fn, n = log.debug, 0
+        for pfx, level in _LOG_PREFIXES:
+            if head.startswith(pfx):
+                fn, n = getattr(log, level), len(pfx)
+                break
         source = "stderr" if is_stderr else "stdout"
-        fn(f"{fn.__name__.upper()} [{source}]: {line}")
-        if line.lower().startswith("FATAL:"):
-            logger.fatal(prefix + line[6:])
-        elif line.startswith("ERROR:"):
-            logger.error(prefix + line[6:])
-        elif line.startswith("WARNING:"):
-            logger.warning(prefix + line[8:])
-        elif line.startswith("INFO:"):
-            logger.info(prefix + line[5:])
-        elif line.startswith("DEBUG:"):
-            logger.debug(prefix + line[6:])
-        else:
-            logger.debug(prefix + line)
+        fn(f"{prefix}[{source}] {line[n:].decode('utf-8').strip()}")
+
+    def _stream_selected(
+        self: Self,
+        p: subprocess.Popen,
+        callback: Callable[[bool, bytes], None],
+        timeout_secs: float | None,
+    ) -> None:
+        # one thread multiplexing both pipes, rather than two reader threads and a queue
+        partial = {False: bytearray(), True: bytearray()}
+        try:
+            with selectors.DefaultSelector() as sel:
+                sel.register(p.stdout, selectors.EVENT_READ, False)
+                sel.register(p.stderr, selectors.EVENT_READ, True)
+                while sel.get_map():
+                    events = sel.select(timeout_secs)
+                    if len(events) == 0:
+                        raise subprocess.TimeoutExpired(p.args, timeout_secs)
+                    for key, _ in events:
+                        is_stderr = key.data
+                        buffer = partial[is_stderr]
+                        chunk = os.read(key.fd, 65536)
+                        if len(chunk) == 0:
+                            sel.unregister(key.fileobj)
+                            if len(buffer) > 0:
+                                callback(is_stderr, bytes(buffer))
+                            continue
+                        # only the new chunk is searched, and a pending line is appended to in place,
+                        # so a long unterminated line costs linear (not quadratic) time
+                        end = chunk.rfind(b"\n") + 1
+                        if end == 0:
+                            buffer += chunk
+                            continue
+                        data = bytes(buffer) + chunk[:end]
+                        buffer[:] = chunk[end:]
+                        for line in data.split(b"\n")[:-1]:
+                            callback(is_stderr, line + b"\n")
+        finally:
+            # also on a timeout or a failing callback, not just at EOF
+            p.stdout.close()
+            p.stderr.close()
+
+    def _stream_threaded(
+        self: Self,
+        p: subprocess.Popen,
+        callback: Callable[[bool, bytes], None],
+        timeout_secs: float | None,
+    ) -> None:
+        q = Queue()
+        Thread(target=self._reader, args=[False, p.stdout, q]).start()
+        Thread(target=self._reader, args=[True, p.stderr, q]).start()
+        n_open = 2
+        while n_open > 0:
+            try:
+                item = q.get(timeout=timeout_secs)
+            except Empty:
+                raise subprocess.TimeoutExpired(p.args, timeout_secs) from None
+            if item is None:
+                n_open -= 1
+            else:
+                callback(*item)
 
     def _reader(self: Self, is_stderr: bool, pipe: IO[AnyStr], queue: Queue):
         try:
@@ -5,6 +5,7 @@
 
 """
 
+import functools
 import logging
 import operator
 import re
@@ -26,6 +27,12 @@ T = TypeVar("T")
 V_co = TypeVar("V_co", covariant=True)
 K_contra = TypeVar("K_contra", contravariant=True)
 logger = logging.getLogger("pocketutils")
+# attrgetter parses its dotted path on construction; reuse getters for repeated paths
+_attrgetter = functools.lru_cache(maxsize=256)(operator.attrgetter)
+_flex_bools = {
+    **{v: True for v in ("true", "t", "yes", "y", "1")},
+    **{v: False for v in ("false", "f", "no", "n", "0")},
+}
 lambda_regex = re.compile(r"^<function (?:[A-Za-z_][A-Za-z0-9_.]*)?(?:<locals>\.)?<lambda> at 0x[A-F0-9]+>$")
 
 
@@ -294,9 +301,10 @@ class CommonUtils:
         """
         if isinstance(s, bool):
             return s
-        if s.lower() == "false":
+        v = s.lower()
+        if v == "false":
             return False
-        if s.lower() == "true":
+        if v == "true":
             return True
         msg = f"{s} is not true/false"
         raise ValueIllegalError(msg, value=s)
@@ -312,13 +320,12 @@ class CommonUtils:
         Raises:
             XValueError: If neither true nor false
         """
-        mp = {
-            **{v: True for v in ("true", "t", "yes", "y", "1")},
-            **{v: False for v in ("false", "f", "no", "n", "0")},
-        }
-        v = mp.get(s.lower())
+        if isinstance(s, bool):
+            return s
+        key = s.lower()
+        v = _flex_bools.get(key)
         if v is None:
-            msg = f"{s.lower()} is not in {','.join(mp.keys())}"
+            msg = f"{key} is not in {','.join(_flex_bools.keys())}"
             raise ValueIllegalError(msg, value=s)
         return v
 
@@ -338,7 +345,7 @@ class CommonUtils:
     ) -> T:
         """
         Returns either the SINGLE (ONLY) UNIQUE ITEM in the sequence or raises an exception.
-        Each item must have __hash__ defined on it.
+        Items are compared with `==`, and iteration stops at the first item that differs.
 
         Args:
             sequence: A list of any items (untyped)
@@ -355,23 +362,24 @@ class CommonUtils:
         """
 
         def _only(sq: Iterable[T]):
-            st = set(sq)
-            if len(st) > 1:
-                raise exception_if_multiple
-            if len(st) == 0:
-                raise exception_if_none
-            return next(iter(st))
+            it = iter(sq)
+            try:
+                first = next(it)
+            except StopIteration:
+                raise exception_if_none from None
+            for x in it:
+                if x != first:
+                    raise exception_if_multiple
+            return first
 
         if condition and isinstance(condition, str):
             return _only(
-                [
-                    s
-                    for s in sequence
-                    if (not self.look(s, condition[1:]) if condition.startswith("!") else self.look(s, condition))
-                ],
+                s
+                for s in sequence
+                if (not self.look(s, condition[1:]) if condition.startswith("!") else self.look(s, condition))
             )
         elif condition:
-            return _only([s for s in sequence if condition(s)])
+            return _only(s for s in sequence if condition(s))
         return _only(sequence)
 
     def forever(self: Self) -> Iterator[int]:
@@ -449,9 +457,9 @@ class CommonUtils:
         if not isinstance(attrs, str) and hasattr(attrs, "__len__") and len(attrs) == 0:
             return obj
         if isinstance(attrs, str):
-            attrs = operator.attrgetter(attrs)
+            attrs = _attrgetter(attrs)
         elif isinstance(attrs, Iterable) and all(isinstance(a, str) for a in attrs):
-            attrs = operator.attrgetter(".".join(attrs))
+            attrs = _attrgetter(".".join(attrs))
         elif not callable(attrs):
             msg = f"Type {type(attrs)} unrecognized for key/attrib. Must be a function, string, or sequence of strings"
             raise TypeError(msg)
@@ -26,12 +26,13 @@ class ConsoleUtils:
         Asks for "yes" or "no" via `input`.
         Consider using `typer.prompt` instead.
         """
+        prompt = msg + " "
         while True:
-            writer(msg + " ")
-            command = input("")
-            if command.lower() == "yes":
+            writer(prompt)
+            command = input("").lower()
+            if command == "yes":
                 return True
-            elif command.lower() == "no":
+            elif command == "no":
                 return False
             else:
                 writer("Enter 'yes' or 'no'.\n")
@@ -54,12 +55,13 @@ class ConsoleUtils:
         Returns:
             True if the user answered 'yes'; False otherwise
         """
+        prompt = msg + " "
         while True:
-            writer(msg + " ")
+            writer(prompt)
             command = input_fn("").lower()
-            if command in ["yes", "y"]:
+            if command in {"yes", "y"}:
                 return True
-            elif command in ["no", "n"]:
+            elif command in {"no", "n"}:
                 return False
 
     def clear_line(self: Self, n: int = 1, writer: Callable[[str], None] = sys.stdout.write) -> None:
@@ -71,9 +73,9 @@ class ConsoleUtils:
             n: The number of lines to erase
             writer: Function to call (passing the string)
         """
-        for _ in range(n):
-            writer(ConsoleTools.CURSOR_UP_ONE)
-            writer(ConsoleTools.ERASE_LINE)
+        if n > 0:
+            # one write call; unbuffered terminals otherwise get 2n syscalls
+            writer((ConsoleTools.CURSOR_UP_ONE + ConsoleTools.ERASE_LINE) * n)
 
 
 ConsoleTools = ConsoleUtils()
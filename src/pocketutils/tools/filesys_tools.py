@@ -5,9 +5,9 @@
 
 """
 
+import errno
 import logging
 import os
-import pathlib
 import shutil
 import stat
 import tempfile
@@ -24,6 +24,23 @@ __all__ = ["FilesysUtils", "FilesysTools", "PathInfo"]
 
 logger = logging.getLogger("pocketutils")
 
+# errors meaning that a path does not exist (the same ones as pathlib's private _ignore_error)
+_missing_errnos = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+_missing_winerrors = frozenset({21, 123, 1921})  # not ready, invalid name, cannot resolve
+
+
+def _is_missing_error(e: OSError) -> bool:
+    return e.errno in _missing_errnos or getattr(e, "winerror", None) in _missing_winerrors
+
+
+def _stat_or_none(path: Path, *, follow_symlinks: bool = True) -> os.stat_result | None:
+    try:
+        return path.stat(follow_symlinks=follow_symlinks)
+    except OSError as e:
+        if not _is_missing_error(e):
+            raise
+        return None
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class PathInfo:
@@ -113,7 +130,7 @@ class PathInfo:
 
     @property
     def is_readable_dir(self: Self) -> bool:
-        return self.is_file and self.has_access and self.has_read
+        return self.is_dir and self.has_access and self.has_read
 
     @property
     def is_writeable_dir(self: Self) -> bool:
@@ -191,16 +208,19 @@ class FilesysUtils:
         """
         paths = [Path(p) for p in paths]
         for path in paths:
-            if path.exists() and not path.is_file():
+            info = _stat_or_none(path)
+            if info is not None and not stat.S_ISREG(info.st_mode):
                 raise ReadFailedError(f"Path {path} is not a file", filename=str(path))
-            if (not missing_ok or path.exists()) and not os.access(path, os.R_OK):
+            # a missing path is never accessible, so only ask the OS about extant ones
+            readable = missing_ok if info is None else os.access(path, os.R_OK)
+            if not readable:
                 raise ReadFailedError(f"Cannot read from {path}", filename=str(path))
             if attempt:
                 try:
                     with open(path):
                         pass
                 except OSError:
-                    raise WriteFailedError(f"Failed to open {path} for read", filename=str(path))
+                    raise ReadFailedError(f"Failed to open {path} for read", filename=str(path))
 
     @classmethod
     def verify_can_write_files(
@@ -222,9 +242,11 @@ class FilesysUtils:
         """
         paths = [Path(p) for p in paths]
         for path in paths:
-            if path.exists() and not path.is_file():
+            info = _stat_or_none(path)
+            if info is not None and not stat.S_ISREG(info.st_mode):
                 raise WriteFailedError(f"Path {path} is not a file", filename=str(path))
-            if (not missing_ok or path.exists()) and not os.access(path, os.W_OK):
+            writable = missing_ok if info is None else os.access(path, os.W_OK)
+            if not writable:
                 raise WriteFailedError(f"Cannot write to {path}", filename=str(path))
             if attempt:
                 try:
@@ -251,29 +273,27 @@ class FilesysUtils:
         """
         paths = [Path(p) for p in paths]
         for path in paths:
-            if path.exists() and not path.is_dir():
+            info = _stat_or_none(path)
+            if info is not None and not stat.S_ISDIR(info.st_mode):
                 raise WriteFailedError(f"Path {path} is not a dir", filename=str(path))
-            if missing_ok and not path.exists():
+            if missing_ok and info is None:
+                continue
+            # check both bits in one call; only split them up to report which is missing
+            if os.access(path, os.W_OK | os.X_OK):
                 continue
             if not os.access(path, os.W_OK):
                 raise WriteFailedError(f"{path} lacks write permission", filename=str(path))
-            if not os.access(path, os.X_OK):
-                raise WriteFailedError(f"{path} lacks access permission", filename=str(path))
+            raise WriteFailedError(f"{path} lacks access permission", filename=str(path))
 
     def get_info(self: Self, path: PurePath | str, *, expand_user: bool = False, strict: bool = False) -> PathInfo:
         path = Path(path)
-        has_ignore_error = hasattr(pathlib, "_ignore_error")
-        if not has_ignore_error:
-            logger.debug("No _ignore_error found; some OSErrors may be suppressed")
         resolved = None
         real_stat = None
         has_access = False
         has_read = False
         has_write = False
-        link_stat = None
         as_of = datetime.now(tz=UTC).astimezone()
-        if has_ignore_error or path.is_symlink() or path.exists():
-            link_stat = self.__stat_raw(path)
+        link_stat = self.__stat_raw(path)
         if link_stat is not None:
             resolved = path.expanduser().resolve(strict=strict) if expand_user else path.resolve(strict=strict)
             real_stat = self.__stat_raw(resolved) if stat.S_ISLNK(link_stat.st_mode) else link_stat
@@ -299,10 +319,12 @@ class FilesysUtils:
         If `exist_ok` is False, calls `logger.warning` if `path` already exists
         """
         path = Path(path)
-        exists = path.exists()
+        # stat once rather than calling exists() and is_dir()
+        info = _stat_or_none(path)
+        exists = info is not None
         # On some platforms we get generic exceptions like permissions errors,
         # so these are better
-        if exists and not path.is_dir():
+        if exists and not stat.S_ISDIR(info.st_mode):
             raise PathMissingError(filename=str(path))
         if exists and not exist_ok:
             logger.warning(f"Directory {path} already exists")
@@ -319,9 +341,11 @@ class FilesysUtils:
         # On some platforms we get generic exceptions like permissions errors, so these are better
         path = Path(path)
         # check for errors first; don't make the dirs and then fail
-        if path.exists() and not path.is_file() and not path.is_symlink():
+        # a single lstat replaces exists() / is_file() / is_symlink()
+        info = _stat_or_none(path, follow_symlinks=False)
+        if info is not None and not stat.S_ISREG(info.st_mode) and not stat.S_ISLNK(info.st_mode):
             raise PathMissingError(filename=str(path))
-        Path(path.parent).mkdir(parents=True, exist_ok=exist_ok)
+        path.parent.mkdir(parents=True, exist_ok=exist_ok)
 
     def delete_surefire(self: Self, path: PurePath | str) -> Exception | None:
         """
@@ -419,7 +443,7 @@ class FilesysUtils:
         try:
             return path.lstat()
         except OSError as e:
-            if hasattr(pathlib, "_ignore_error") and not pathlib._ignore_error(e):
+            if not _is_missing_error(e):
                 raise e
         return None
 
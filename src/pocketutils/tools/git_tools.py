@@ -23,19 +23,6 @@ def _call(cmd: list[str], cwd: Path = Path.cwd()) -> str:
     return subprocess.check_output(cmd, cwd=cwd, encoding="utf-8").strip()  # noqa: S603,S607
 
 
-@dataclass(frozen=True, order=True, slots=True)
-class GitDescription:
-    """
-    Data collected from running `git describe --long --dirty --broken --abbrev=40 --tags`.
-    """
-
-    tag: str
-    commits: str
-    hash: str
-    is_dirty: bool
-    is_broken: bool
-
-
 @dataclass(frozen=True, order=True, slots=True)
 class GitConfig:
     user: str
@@ -12,8 +12,9 @@ import functools
 import hashlib
 import os
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Literal, Self, SupportsBytes
+from typing import Any, Literal, Self, SupportsBytes
 
 from pocketutils.core.input_output import DevNull
 
@@ -237,29 +238,48 @@ ENCODINGS = {
 }
 
 
+# shorthand (lowercase, without hyphens) -> encoding with a BOM
+_bom_encodings = {
+    "utf8(bom)": "utf-8-sig",
+    "utf16(bom)": "utf-16-sig",
+    "utf32(bom)": "utf-32-sig",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _hash_constructor(algorithm: str) -> Callable[..., Any]:
+    """
+    Resolves a `HashAlgorithm` to a hashlib constructor.
+    Names like `sha2_256` are mapped to hashlib's `sha256`.
+    """
+    name = "sha" + algorithm.removeprefix("sha2_") if algorithm.startswith("sha2_") else algorithm
+    # the named constructors (e.g. hashlib.sha256) skip hashlib.new's name lookup;
+    # anything else goes through hashlib.new, which raises ValueError for unknown names
+    if name in hashlib.algorithms_guaranteed:
+        return getattr(hashlib, name)
+    return functools.partial(hashlib.new, name)
+
+
 @dataclass(slots=True, frozen=True)
 class IoUtils:
     def get_encoding(self: Self, encoding: str = "utf-8") -> str:
         """
         Returns a text encoding from a more flexible string.
-        Ignores hyphens and lowercases the string.
-        Permits these nonstandard shorthands:
+        Lowercases the string.
+        Permits these nonstandard shorthands (ignoring hyphens):
 
           - `"platform"`: use `sys.getdefaultencoding()` on the fly
           - `"utf-8(bom)"`: use `"utf-8-sig"` on Windows; `"utf-8"` otherwise
           - `"utf-16(bom)"`: use `"utf-16-sig"` on Windows; `"utf-16"` otherwise
           - `"utf-32(bom)"`: use `"utf-32-sig"` on Windows; `"utf-32"` otherwise
         """
-        encoding = encoding.lower().replace("-", "")
-        if encoding == "platform":
-            encoding = sys.getdefaultencoding()
-        if encoding == "utf-8(bom)":
-            encoding = "utf-8-sig" if os.name == "nt" else "utf-8"
-        if encoding == "utf-16(bom)":
-            encoding = "utf-16-sig" if os.name == "nt" else "utf-16"
-        if encoding == "utf-32(bom)":
-            encoding = "utf-32-sig" if os.name == "nt" else "utf-32"
-        return encoding
+        key = encoding.lower()
+        if key == "platform":
+            return sys.getdefaultencoding()
+        bom = _bom_encodings.get(key.replace("-", ""))
+        if bom is not None:
+            return bom if os.name == "nt" else bom.removesuffix("-sig")
+        return key
 
     def get_encoding_errors(self: Self, errors: str | None) -> str | None:
         """
@@ -293,17 +313,18 @@ class IoUtils:
         **kwargs,
     ) -> bytes:
         kwargs = {"usedforsecurity": False} | kwargs
-        x = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        if isinstance(data, str):
+            x = data.encode("utf-8")
+        elif isinstance(data, bytes | bytearray | memoryview):
+            x = data  # hashlib and binascii read the buffer directly; don't copy it
+        else:
+            x = bytes(data)
         if algorithm == "crc32":
-            return bytes(binascii.crc32(x))
-        elif algorithm.startswith("shake_"):
-            m = getattr(hashlib, algorithm)(**kwargs)
-            m.update(x)
+            return binascii.crc32(x).to_bytes(4, "big")
+        m = _hash_constructor(algorithm)(x, **kwargs)
+        if algorithm.startswith("shake_"):
             return m.digest(128 if digest_length is None else digest_length)
-        else:
-            m = hashlib.new(algorithm, **kwargs)
-            m.update(x)
-            return m.digest()
+        return m.digest()
 
     def encode(self: Self, d: bytes, enc: Encoding = "base64") -> str:
         if enc not in ENCODINGS:
@@ -117,16 +117,17 @@ class JsonDecoder:
     def from_bytes(self: Self, data: bytes | bytearray | memoryview) -> Any:
         if not isinstance(data, bytes | bytearray | memoryview):
             raise TypeError(str(type(data)))
-        if not isinstance(data, bytes):
-            data = bytes(data)
         if orjson:
+            # orjson reads the buffer and decodes UTF-8 itself; copying or decoding here is wasted work
             return orjson.loads(data)
-        return json.loads(data.decode(encoding="utf-8"))
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
 
     def from_str(self: Self, data: str) -> Any:
         if orjson:
             return orjson.loads(data)
-        json.loads(data)
+        return json.loads(data)
 
 
 @dataclass(slots=True, frozen=True)
@@ -188,8 +189,6 @@ class JsonUtils:
                   only for :meth:`pocketutils.tools.json_tools.JsonEncoder.as_str`
             last: Last resort option to encode a value
         """
-        import orjson
-
         bytes_option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
         str_option = orjson.OPT_UTC_Z
         if sort:
@@ -10,7 +10,6 @@ import os
 import re
 import sys
 from collections.abc import Callable, Sequence
-from copy import copy
 from dataclasses import dataclass
 from pathlib import Path, PurePath
 from typing import Any, Self
@@ -35,6 +34,7 @@ _bad_chars = {
     *{chr(c) for c in range(32)},
     "\t",
 }
+_bad_chars_table = str.maketrans(dict.fromkeys(_bad_chars, "_"))
 
 # note that we can't call WindowsPath.is_reserved because it can't be instantiated on non-Linux
 # also, these appear to be different from the ones defined there
@@ -205,8 +205,8 @@ class PathUtils:
             is_root_or_drive = False
         if is_root_or_drive is True and is_file is None:
             is_file = False
-        source_bit = copy(str(bit))
-        bit = str(bit).strip()
+        source_bit = str(bit)
+        bit = source_bit.strip()
         # first, catch root or drive as long as is_root_or_drive is not false
         # if is_root_or_drive is True (which is a weird call), then fail if it's not
         # otherwise, it's not a root or drive letter, so keep going
@@ -234,8 +234,7 @@ class PathUtils:
         if set(bit.replace(" ", "")) == "." and bit not in ["..", "."]:
             bit = "_" + bit + "_"
             # raise IllegalPathError(f"Node '{source_bit}' is invalid")
-        for q in _bad_chars:
-            bit = bit.replace(q, "_")
+        bit = bit.translate(_bad_chars_table)  # one pass, rather than one replace() per character
         bad_strs = _bad_strs_fat if fat else _bad_strs
         if bit.upper() in bad_strs:
             # arbitrary decision
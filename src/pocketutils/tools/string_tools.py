@@ -19,6 +19,11 @@ __all__ = ["StringUtils", "StringTools"]
 
 K_contra = TypeVar("K_contra", contravariant=True)
 V_co = TypeVar("V_co", covariant=True)
+# built once; str.translate then maps every character in a single C-level pass
+_to_superscript = str.maketrans("0123456789-+=()", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺⁼⁽⁾")
+_to_subscript = str.maketrans("0123456789+-=()", "₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎")
+_from_superscript = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺⁼⁽⁾", "0123456789-+=()")
+_from_subscript = str.maketrans("₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎", "0123456789+-=()")
 _control_chars = regex.compile(r"\p{C}", flags=regex.VERSION1)
 
 
@@ -59,7 +64,7 @@ class StringUtils:
 
     def strip_control_chars(self: Self, s: str) -> str:
         """
-        Strips all characters under the Unicode 'Cc' category.
+        Strips all characters under the Unicode 'C' categories (Cc, Cf, Cs, Co, and Cn).
         """
         return _control_chars.sub("", s)
 
@@ -257,25 +262,25 @@ class StringUtils:
         """
         Replaces digits, +, =, (, and ) with equivalent Unicode superscript chars (ex ¹).
         """
-        return "".join(dict(zip("0123456789-+=()", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺⁼⁽⁾")).get(c, c) for c in s)
+        return str(s).translate(_to_superscript)
 
     def replace_digits_with_subscript_chars(self: Self, s: str | float) -> str:
         """
         Replaces digits, +, =, (, and ) with equivalent Unicode subscript chars (ex ₁).
         """
-        return "".join(dict(zip("0123456789+-=()", "₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎")).get(c, c) for c in s)
+        return str(s).translate(_to_subscript)
 
     def replace_superscript_chars_with_digits(self: Self, s: str | float) -> str:
         """
         Replaces Unicode superscript digits, +, =, (, and ) with normal chars.
         """
-        return "".join(dict(zip("⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺⁼⁽⁾", "0123456789-+=()")).get(c, c) for c in s)
+        return str(s).translate(_from_superscript)
 
     def replace_subscript_chars_with_digits(self: Self, s: str | float) -> str:
         """
         Replaces Unicode superscript digits, +, =, (, and ) with normal chars.
         """
-        return "".join(dict(zip("₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎", "0123456789+-=()")).get(c, c) for c in s)
+        return str(s).translate(_from_subscript)
 
     def pretty_float(self: Self, v: float | int, n_sigfigs: int | None = 5) -> str:
         """
@@ -407,7 +412,7 @@ class StringUtils:
         """
         Returns a dict from Greek lowercase+uppercase letter names to their Unicode chars.
         """
-        return {v: k for k, v in StringTools._greek_alphabet.items()}
+        return dict(_greek_names_to_chars)
 
     def replace_greek_letter_names_with_chars(self: Self, s: str, lowercase: bool = False) -> str:
         """
@@ -417,18 +422,10 @@ class StringUtils:
         If lowercase is True: Replaces Beta, BeTa, and BETA with β
         Else: Replaces Beta with a capital Greek Beta and ignores BETA and BeTa.
         """
-        # Clever if I may say so:
-        # If we just sort from longest to shortest, we can't replace substrings by accident
-        # For example we'll replace 'beta' before 'eta', so '1-beta' won't become '1-bη'
-        greek = sorted(
-            [(v, k) for k, v in StringTools._greek_alphabet.items()],
-            key=lambda t: -len(t[1]),
-        )
-        for k, v in greek:
-            if k[0].isupper() and lowercase:
-                continue
-            s = re.compile(k | regex.IGNORECASE).sub(v, s) if lowercase else s.replace(k, v)
-        return s
+        # one pass with a precompiled alternation (names longest first; see _greek_pattern)
+        if lowercase:
+            return _greek_pattern_ci.sub(lambda m: _greek_names_to_chars[m.group().lower()], s)
+        return _greek_pattern.sub(lambda m: _greek_names_to_chars[m.group()], s)
 
     def dict_to_compact_str(self: Self, seq: Mapping[K_contra, V_co], *, eq: str = "=", sep: str = ", ") -> str:
         return self.dict_to_str(seq, sep=sep, eq=eq)
@@ -510,4 +507,14 @@ class StringUtils:
     }
 
 
+_greek_names_to_chars = {v: k for k, v in StringUtils._greek_alphabet.items()}
+# Clever if I may say so:
+# If we just sort from longest to shortest, we can't replace substrings by accident
+# For example we'll match 'beta' before 'eta', so '1-beta' won't become '1-bη'
+_greek_pattern = re.compile("|".join(sorted(_greek_names_to_chars, key=len, reverse=True)))
+_greek_pattern_ci = re.compile(
+    "|".join(sorted([k for k in _greek_names_to_chars if k.islower()], key=len, reverse=True)),
+    flags=re.IGNORECASE,
+)
+
 StringTools = StringUtils()
@@ -30,6 +30,11 @@ __all__ = ["Frame", "SerializedException", "SignalHandler", "ExitHandler", "Syst
 logger = logging.getLogger("pocketutils")
 
 
+def _format_stack() -> str:
+    # one string for a single sink write; drops this function's own frame
+    return "".join(traceback.format_stack()[:-1])
+
+
 @dataclass(frozen=True, slots=True, order=True, kw_only=True)
 class Frame:
     depth: int
@@ -56,9 +61,7 @@ class SignalHandler:
 
     def __call__(self: Self) -> None:
         self.sink.write(f"~~{self.name}[{self.code}] ({self.desc})~~")
-        traceback.print_stack(file=self.sink)
-        for line in traceback.format_stack():
-            self.sink.write(line)
+        self.sink.write(_format_stack())
 
 
 @dataclass(frozen=True, slots=True)
@@ -67,9 +70,7 @@ class ExitHandler:
 
     def __call__(self: Self) -> None:
         self.sink.write("~~EXIT~~")
-        traceback.print_stack(file=self.sink)
-        for line in traceback.format_stack():
-            self.sink.write(line)
+        self.sink.write(_format_stack())
 
 
 @dataclass(slots=True, frozen=True)
@@ -191,7 +192,7 @@ class SystemUtils:
     def serialize_exception(self: Self, e: BaseException) -> SerializedException:
         tbe = traceback.TracebackException.from_exception(e)
         msg = list(tbe.format_exception_only())
-        tb = self.build_traceback(e)
+        tb = self._build_traceback(tbe)
         return SerializedException(msg, tb)
 
     def serialize_exception_msg(self: Self, e: BaseException) -> Sequence[str]:
@@ -199,12 +200,14 @@ class SystemUtils:
         return list(tbe.format_exception_only())
 
     def build_traceback(self: Self, e: BaseException) -> Sequence[Frame]:
+        return self._build_traceback(traceback.TracebackException.from_exception(e))
+
+    def _build_traceback(self: Self, tbe: traceback.TracebackException) -> Sequence[Frame]:
         tb = []
         current = None
-        tbe = traceback.TracebackException.from_exception(e)
         last, repeats = None, 0
         for i, s in enumerate(tbe.stack):
-            current = Frame(depth=i, filename=s.filename, line=int(s.line), name=s.name, repeats=-1)
+            current = Frame(depth=i, filename=s.filename, line=s.lineno, name=s.name, repeats=-1)
             if current == last:
                 repeats += 1
             else:
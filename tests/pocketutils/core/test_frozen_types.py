@@ -77,6 +77,11 @@ class TestFrozen:
         assert not x < x
         assert not y < y
         assert not z < z
+        x2: FrozeDict = CommonTools.freeze({2: "dog", 1: "cat"})
+        assert x is not x2
+        assert x <= x2 and x >= x2 and not x < x2 and not x > x2
+        assert z > x and z >= x and y > x and y >= x and x <= y and z >= y
+        assert not x > z and not x >= z
         assert hash(x) == hash(x) and hash(y) == hash(y) and hash(z) == hash(z)
         assert hash(x) != hash(y)
         assert x.get(1) == "cat"
@@ -1,11 +1,13 @@
 # SPDX-FileCopyrightText: Copyright 2020-2023, Contributors to pocketutils
 # SPDX-PackageHomePage: https://github.com/dmyersturnbull/pocketutils
 # SPDX-License-Identifier: Apache-2.0
+import logging
 from io import StringIO
 from typing import Self
 
 import pytest
-from pocketutils.core.input_output import Capture, DelegatingWriter, OpenMode
+from pocketutils.core.exceptions import ValueIllegalError
+from pocketutils.core.input_output import Capture, DelegatingWriter, LogWriter, OpenMode
 from pocketutils.core.mocks import MockWritable
 
 
@@ -31,6 +33,33 @@ class TestIo:
         c = Capture(w)
         assert c.value == "abc"
 
+    def test_capture_len(self: Self) -> None:
+        w = StringIO("abcdé")
+        c = Capture(w)
+        assert len(c) == 5
+        w.seek(2)
+        assert len(c) == 5
+        assert w.tell() == 2  # position restored
+        assert w.read() == "cdé"
+        w.write("xyz")
+        assert len(c) == 8
+
+    def test_capture_lines(self: Self) -> None:
+        assert Capture(StringIO("a\nb\n")).lines == ["a", "b"]
+        assert Capture(StringIO("a\r\nb\rc\u2028d")).lines == ["a", "b", "c", "d"]
+        assert Capture(StringIO("")).lines == []
+        assert Capture(StringIO("a\nb\n")).split("\n") == ["a", "b", ""]
+
+    def test_log_writer(self: Self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.DEBUG, logger="pocketutils"):
+            assert LogWriter("warning").write("abc") == 3
+            LogWriter(logging.DEBUG).write("xyz")
+        assert [(r.levelno, r.message) for r in caplog.records] == [(logging.WARNING, "abc"), (logging.DEBUG, "xyz")]
+        with pytest.raises(ValueIllegalError) as e:
+            LogWriter("foo")
+        assert e.value.args[0] == "Unknown log level foo"
+        assert e.value.value == "foo"
+
     def test_open_mode_normalize(self: Self) -> None:
         o = OpenMode
         assert str(o("").normalize()) == "rt"
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright 2020-2023, Contributors to pocketutils
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/pocketutils
+# SPDX-License-Identifier: Apache-2.0
+import bz2
+import gzip
+from pathlib import Path
+from typing import Self
+
+import pytest
+from pocketutils.core.exceptions import KeyReusedError, PathExistsError
+from pocketutils.core.smartio import AbstractSmartIo, Compression, CompressionSet
+
+
+class _StdlibSmartIo(AbstractSmartIo):
+    # SmartIo needs brotli, lz4, snappy and zstandard; the stdlib formats are enough here
+    def _new_compression_list(self: Self) -> CompressionSet:
+        return CompressionSet._build(
+            [
+                Compression("gzip", [".gz", ".gzip"], gzip.compress, gzip.decompress),
+                Compression("bzip2", [".bz2", ".bzip2"], bz2.compress, bz2.decompress),
+            ],
+            CompressionSet.empty().mapping,
+        )
+
+
+class TestSmartIo:
+    def test_write_atomic(self: Self, tmp_path: Path) -> None:
+        io = _StdlibSmartIo()
+        path = tmp_path / "f.txt.gz"
+        io.write(b"hi", path, atomic=True)
+        assert io.read_bytes(path) == b"hi"
+        assert gzip.decompress(path.read_bytes()) == b"hi"
+        assert [p.name for p in tmp_path.iterdir()] == ["f.txt.gz"]
+
+    def test_write_to_dir(self: Self, tmp_path: Path) -> None:
+        with pytest.raises(PathExistsError):
+            _StdlibSmartIo().write(b"hi", tmp_path, exist_ok=True)
+
+    def test_write_exists(self: Self, tmp_path: Path) -> None:
+        io = _StdlibSmartIo()
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"old")
+        with pytest.raises(PathExistsError):
+            io.write(b"new", path)
+        assert path.read_bytes() == b"old"
+        io.write(b"new", path, exist_ok=True)
+        assert path.read_bytes() == b"new"
+
+    def test_add_conflict(self: Self) -> None:
+        gz = Compression("gzip", [".gz"], gzip.compress, gzip.decompress)
+        other = Compression("other", [".gz"], bz2.compress, bz2.decompress)
+        compressions = CompressionSet.empty() + gz
+        assert (compressions + gz).mapping == compressions.mapping
+        with pytest.raises(KeyReusedError):
+            _ = compressions + other
+
+    def test_compressions_cached(self: Self) -> None:
+        io = _StdlibSmartIo()
+        assert io.compressions is io.compressions
+        assert io.compressions["gzip"].suffixes == [".gz", ".gzip"]
+
+    def test_guess(self: Self) -> None:
+        compressions = _StdlibSmartIo().compressions
+        assert compressions.guess("x.gz").name == "gzip"
+        assert compressions.guess("x.txt.bzip2").name == "bzip2"
+        assert compressions.guess(Path("x")).name == ""
+        assert compressions.guess(Path("x.txt")).name == ""
+
+    def test_all_suffixes(self: Self) -> None:
+        assert sorted(_StdlibSmartIo().all_suffixes) == [".bz2", ".bzip2", ".gz", ".gzip"]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright 2020-2023, Contributors to pocketutils
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/pocketutils
+# SPDX-License-Identifier: Apache-2.0
+import ast
+import importlib
+import inspect
+from typing import Self
+
+import pytest
+
+import pocketutils
+from pocketutils.tools.common_tools import CommonTools
+
+
+class TestInit:
+    def test_all(self: Self) -> None:
+        assert len(pocketutils.__all__) == len(set(pocketutils.__all__))
+        for name in pocketutils.__all__:
+            assert getattr(pocketutils, name) is not None
+
+    def test_lazy(self: Self) -> None:
+        assert pocketutils.CommonTools is CommonTools
+        assert pocketutils.Tools.only([1]) == 1
+        with pytest.raises(AttributeError):
+            _ = pocketutils.NotAName
+
+    def test_utils_bases(self: Self) -> None:
+        for name in pocketutils._UTILS_MIXINS:
+            mixin = getattr(pocketutils, name)
+            assert issubclass(pocketutils.Utils, mixin)
+            assert isinstance(pocketutils.Tools, mixin)
+
+    def test_lazy_matches_modules(self: Self) -> None:
+        core = set(pocketutils.__all__) - set(pocketutils._LAZY) - {"Utils", "Tools"}
+        by_module = {}
+        for name, module in pocketutils._LAZY.items():
+            by_module.setdefault(module, []).append(name)
+        for module, names in by_module.items():
+            exported = [n for n in importlib.import_module(module).__all__ if n not in core]
+            if module == "pocketutils.tools.json_tools":
+                # only the mixin; the encoder/decoder types stay in json_tools
+                assert set(names) <= set(exported)
+            else:
+                assert set(names) == set(exported), module
+
+    def test_type_checking_matches_lazy(self: Self) -> None:
+        tree = ast.parse(inspect.getsource(pocketutils))
+        block = next(n for n in tree.body if isinstance(n, ast.If) and ast.unparse(n.test) == "TYPE_CHECKING")
+        imported = {a.name for n in block.body if isinstance(n, ast.ImportFrom) for a in n.names}
+        assert imported == set(pocketutils._LAZY)
+        utils = next(n for n in block.body if isinstance(n, ast.ClassDef) and n.name == "Utils")
+        assert [b.id for b in utils.bases] == pocketutils._UTILS_MIXINS
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: Copyright 2020-2023, Contributors to pocketutils
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/pocketutils
+# SPDX-License-Identifier: Apache-2.0
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from subprocess import CalledProcessError, TimeoutExpired
+from typing import Self
+
+import pytest
+from pocketutils.tools.call_tools import CallTools
+
+_WRITE_BOTH = """
+import sys, time
+sys.stdout.write("out 1\\nout ")
+sys.stdout.flush()
+time.sleep(0.05)
+sys.stdout.write("2\\n" + "x" * 200000 + "\\nlast")
+sys.stderr.write("err 1\\nerr 2\\n")
+"""
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+class TestCallTools:
+    def test_call_cmd_utf(self: Self, tmp_path: Path) -> None:
+        x = CallTools.call_cmd_utf(*_python("import os; print(' ' + os.getcwd() + ' ')"), cwd=tmp_path)
+        assert x.returncode == 0
+        assert x.stdout == str(tmp_path)
+        assert x.stderr == ""
+
+    def test_call_cmd_utf_fail(self: Self) -> None:
+        with pytest.raises(CalledProcessError) as e:
+            CallTools.call_cmd_utf(*_python("import sys; sys.stderr.write('bad'); sys.exit(2)"))
+        assert e.value.returncode == 2
+        assert e.value.stderr == "bad"
+
+    def test_stream_cmd_call(self: Self) -> None:
+        seen = []
+        CallTools.stream_cmd_call(_python(_WRITE_BOTH), callback=lambda e, line: seen.append((e, line)))
+        stdout = [line for is_stderr, line in seen if not is_stderr]
+        stderr = [line for is_stderr, line in seen if is_stderr]
+        assert stdout == [b"out 1\n", b"out 2\n", b"x" * 200000 + b"\n", b"last"]
+        assert stderr == [b"err 1\n", b"err 2\n"]
+
+    def test_stream_cmd_call_fail(self: Self) -> None:
+        with pytest.raises(CalledProcessError):
+            CallTools.stream_cmd_call(_python("import sys; sys.exit(3)"), callback=lambda e, line: None)
+
+    @pytest.mark.skipif(os.name == "nt", reason="selectors only accept sockets on Windows")
+    def test_stream_selected_timeout(self: Self) -> None:
+        p = subprocess.Popen(_python("import time; time.sleep(10)"), stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # noqa: S603
+        try:
+            with pytest.raises(TimeoutExpired):
+                CallTools._stream_selected(p, lambda e, line: None, 0.1)
+            assert p.stdout.closed
+            assert p.stderr.closed
+        finally:
+            p.kill()
+            p.wait()
+
+    @pytest.mark.skipif(os.name == "nt", reason="selectors only accept sockets on Windows")
+    def test_stream_selected_callback_error(self: Self) -> None:
+        def fail(is_stderr: bool, line: bytes) -> None:
+            raise ValueError(line)
+
+        p = subprocess.Popen(_python("print('hi')"), stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # noqa: S603
+        try:
+            with pytest.raises(ValueError):
+                CallTools._stream_selected(p, fail, None)
+            assert p.stdout.closed
+            assert p.stderr.closed
+        finally:
+            p.wait()
+
+    def test_stream_threaded(self: Self) -> None:
+        seen = []
+        p = subprocess.Popen(_python(_WRITE_BOTH), stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # noqa: S603
+        try:
+            CallTools._stream_threaded(p, lambda e, line: seen.append((e, line)), 5)
+        finally:
+            p.wait()
+        assert [line for is_stderr, line in seen if is_stderr] == [b"err 1\n", b"err 2\n"]
+        assert [line for is_stderr, line in seen if not is_stderr][-1] == b"last"
+
+    def test_stream_threaded_timeout(self: Self) -> None:
+        p = subprocess.Popen(_python("import time; time.sleep(10)"), stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # noqa: S603
+        try:
+            with pytest.raises(TimeoutExpired):
+                CallTools._stream_threaded(p, lambda e, line: None, 0.1)
+        finally:
+            p.kill()
+            p.wait()
+
+    def test_smart_log(self: Self, caplog: pytest.LogCaptureFixture) -> None:
+        lines = [
+            b"FATAL: oh no\n",
+            b"error:bad\n",
+            b"Warning: hmm\n",
+            b"INFO: fyi \n",
+            b"debug: detail\n",
+            b"  plain text  \n",
+            b"notice: \xce\xb2\n",
+        ]
+        with caplog.at_level(logging.DEBUG, logger="pocketutils"):
+            for line in lines:
+                CallTools.smart_log(True, line)
+        assert [(r.levelno, r.message) for r in caplog.records] == [
+            (logging.CRITICAL, "[stderr] oh no"),
+            (logging.ERROR, "[stderr] bad"),
+            (logging.WARNING, "[stderr] hmm"),
+            (logging.INFO, "[stderr] fyi"),
+            (logging.DEBUG, "[stderr] detail"),
+            (logging.DEBUG, "[stderr] plain text"),
+            (logging.DEBUG, "[stderr] notice: \u03b2"),
+        ]
+
+    def test_smart_log_stdout_prefix(self: Self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.DEBUG, logger="pocketutils"):
+            CallTools.smart_log(False, b"INFO: hi", prefix="tool ")
+        assert [(r.levelno, r.message) for r in caplog.records] == [(logging.INFO, "tool [stdout] hi")]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -6,7 +6,7 @@ from typing import Any, Self
 
 import numpy as np
 import pytest
-from pocketutils.core.exceptions import MultipleMatchesError, NoMatchesError
+from pocketutils.core.exceptions import MultipleMatchesError, NoMatchesError, ValueIllegalError
 from pocketutils.core.mocks import MockCallable, MockWritable, WritableCallable
 from pocketutils.tools.common_tools import CommonTools
 
@@ -37,6 +37,10 @@ class TestCommon:
             only(["a", "b"])
         with pytest.raises(NoMatchesError):
             only([])
+        assert only(["a", "a"]) == "a"
+        assert only([["x"], ["x"]]) == ["x"]
+        with pytest.raises(MultipleMatchesError):
+            only(CommonTools.forever())
 
     def test_look(self: Self) -> None:
         f = CommonTools.look
@@ -142,6 +146,14 @@ class TestCommon:
         f = CommonTools.longest
         assert f(["1", "abc", "xyz", "2"]) == "abc"
 
+    def test_parse_bool(self: Self) -> None:
+        assert CommonTools.parse_bool("TRUE") is True
+        assert CommonTools.parse_bool("false") is False
+        assert CommonTools.parse_bool_flex("Yes") is True
+        assert CommonTools.parse_bool_flex("0") is False
+        with pytest.raises(ValueIllegalError):
+            CommonTools.parse_bool_flex("maybe")
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -1,10 +1,12 @@
 # SPDX-FileCopyrightText: Copyright 2020-2023, Contributors to pocketutils
 # SPDX-PackageHomePage: https://github.com/dmyersturnbull/pocketutils
 # SPDX-License-Identifier: Apache-2.0
+import os
 from pathlib import Path
 from typing import Self
 
 import pytest
+from pocketutils.core.exceptions import ReadFailedError, WriteFailedError
 from pocketutils.tools.filesys_tools import FilesysTools
 
 
@@ -25,6 +27,34 @@ class TestFilesysTools:
         assert not info.is_file
         assert info.mod_or_create_dt is not None
 
+    def test_get_info_missing(self: Self) -> None:
+        info = FilesysTools.get_info(load("lines.lines") / "nope")
+        assert not info.exists
+        assert info.resolved is None
+        assert not info.has_read
+
+    def test_verify_can(self: Self) -> None:
+        file = load("lines.lines")
+        FilesysTools.verify_can_read_files(file)
+        FilesysTools.verify_can_read_files(file.parent / "nope", missing_ok=True)
+        FilesysTools.verify_can_write_dirs(file.parent)
+        with pytest.raises(ReadFailedError):
+            FilesysTools.verify_can_read_files(file.parent / "nope")
+        with pytest.raises(ReadFailedError):
+            FilesysTools.verify_can_read_files(file.parent)
+        with pytest.raises(WriteFailedError):
+            FilesysTools.verify_can_write_dirs(file)
+        assert FilesysTools.get_info(file.parent).is_readable_dir
+        assert not FilesysTools.get_info(file).is_readable_dir
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    def test_verify_can_symlink_loop(self: Self, tmp_path: Path) -> None:
+        loop = tmp_path / "loop"
+        loop.symlink_to(loop)
+        FilesysTools.verify_can_read_files(loop, missing_ok=True)
+        with pytest.raises(ReadFailedError):
+            FilesysTools.verify_can_read_files(loop)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -1,3 +1,49 @@
 # SPDX-FileCopyrightText: Copyright 2020-2023, Contributors to pocketutils
 # SPDX-PackageHomePage: https://github.com/dmyersturnbull/pocketutils
 # SPDX-License-Identifier: Apache-2.0
+import binascii
+import hashlib
+import os
+import sys
+from typing import Self
+
+import pytest
+from pocketutils.tools.io_tools import IoTools
+
+
+class TestIoTools:
+    def test_get_encoding(self: Self) -> None:
+        assert IoTools.get_encoding("UTF-8") == "utf-8"
+        assert IoTools.get_encoding("utf-8-sig") == "utf-8-sig"
+        assert IoTools.get_encoding("platform") == sys.getdefaultencoding()
+        bom = "utf-16-sig" if os.name == "nt" else "utf-16"
+        assert IoTools.get_encoding("UTF-16(BOM)") == bom
+        assert IoTools.get_encoding("utf16(bom)") == bom
+
+    def test_hash_digest(self: Self) -> None:
+        data = b"hello world"
+        expected = hashlib.md5(data, usedforsecurity=False).digest()
+        assert IoTools.hash_digest(data, "md5") == expected
+        assert IoTools.hash_digest("hello world", "md5") == expected
+        assert IoTools.hash_digest(bytearray(data), "md5") == expected
+        assert IoTools.hash_digest(memoryview(data), "md5") == expected
+
+    def test_hash_digest_names(self: Self) -> None:
+        data = b"hello world"
+        assert IoTools.hash_digest(data, "sha2_256") == hashlib.sha256(data).digest()
+        assert IoTools.hash_digest(data, "sha3_224") == hashlib.sha3_224(data).digest()
+        assert IoTools.hash_digest(data, "shake_128", digest_length=16) == hashlib.shake_128(data).digest(16)
+
+    def test_hash_digest_invalid(self: Self) -> None:
+        for name in ["new", "file_digest", "pbkdf2_hmac", "scrypt", "sha2_999"]:
+            with pytest.raises(ValueError):
+                IoTools.hash_digest(b"x", name)
+
+    def test_hash_digest_crc32(self: Self) -> None:
+        x = IoTools.hash_digest(b"hello world", "crc32")
+        assert len(x) == 4
+        assert int.from_bytes(x, "big") == binascii.crc32(b"hello world")
+
+
+if __name__ == "__main__":
+    pytest.main()
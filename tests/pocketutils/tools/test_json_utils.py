@@ -38,6 +38,17 @@ class TestJsonTools:
         default = JsonTools.new_default(fixer)
         assert default(X()) == "gotcha!"
 
+    def test_decoder(self) -> None:
+        decoder = JsonTools.decoder()
+        data = b'{"a": [1, "\xce\xb2"]}'
+        expected = {"a": [1, "β"]}
+        assert decoder.from_bytes(data) == expected
+        assert decoder.from_bytes(bytearray(data)) == expected
+        assert decoder.from_bytes(memoryview(data)) == expected
+        assert decoder.from_str(data.decode("utf-8")) == expected
+        with pytest.raises(TypeError):
+            decoder.from_bytes(data.decode("utf-8"))
+
     def test_to_json(self):
         assert JsonTools.encoder().as_str("hi") == '"hi"\n'
         assert JsonTools.encoder().as_str(["hi", "bye"]) == '[\n  "hi",\n  "bye"\n]\n'
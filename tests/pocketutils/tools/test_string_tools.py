@@ -32,15 +32,32 @@ class TestStringTools:
         assert None is f(None, 4)
         assert f(None, 4, null="xx") == "xx"
 
-    def fix_greek(self: Self) -> None:
+    def test_fix_greek(self: Self) -> None:
         f = StringTools.replace_greek_letter_names_with_chars
         assert f("beta") == "\u03B2"
         assert f("theta") == "\u03B8"
         assert f("Beta") == "\u0392"
         assert f("BETA") == "BETA"
-        assert f("BETA", lowercase=True) == "BETA"
+        assert f("BETA", lowercase=True) == "\u03B2"
         assert f("Beta", lowercase=True) == "\u03B2"
 
+    def test_strip_control_chars(self: Self) -> None:
+        f = StringTools.strip_control_chars
+        assert f("") == ""
+        assert f("ab\x00c\x1b\x7f") == "abc"
+        assert f("tab\tnew\nline") == "tabnewline"
+        assert f("zero\u200bwidth\u00ad") == "zerowidth"
+        assert f("☢ é 人") == "☢ é 人"
+        assert f("emoji 😀\U000f0000\U000e0001") == "emoji 😀"
+        assert f("\ud800\uffff\ue000x") == "x"
+
+    def test_super_and_subscript_chars(self: Self) -> None:
+        t = StringTools
+        assert t.replace_digits_with_superscript_chars("x2+(10)") == "x²⁺⁽¹⁰⁾"
+        assert t.replace_digits_with_subscript_chars("H2O") == "H₂O"
+        assert t.replace_superscript_chars_with_digits("x²⁺⁽¹⁰⁾") == "x2+(10)"
+        assert t.replace_subscript_chars_with_digits("H₂O") == "H2O"
+
     def test_tabs_to_list(self: Self) -> None:
         assert ["a", "b", "c\td", "e"] == StringTools.tabs_to_list('a\t"b"\t"c\td"\te')
 
@@ -1,10 +1,11 @@
 # SPDX-FileCopyrightText: Copyright 2020-2023, Contributors to pocketutils
 # SPDX-PackageHomePage: https://github.com/dmyersturnbull/pocketutils
 # SPDX-License-Identifier: Apache-2.0
+from io import StringIO
 from typing import Self
 
 import pytest
-from pocketutils.tools.sys_tools import SystemTools
+from pocketutils.tools.sys_tools import ExitHandler, SystemTools
 
 
 class TestSysTools:
@@ -38,6 +39,23 @@ class TestSysTools:
         assert "orjson" in data
         assert data["orjson"].startswith("3.")  # change when updated
 
+    def test_exit_handler(self: Self) -> None:
+        sink = StringIO()
+        ExitHandler(sink)()
+        out = sink.getvalue()
+        assert out.startswith("~~EXIT~~")
+        assert out.count("test_exit_handler") == 1
+        assert "in _format_stack" not in out
+
+    def test_serialize_exception(self: Self) -> None:
+        try:
+            msg = "nope"
+            raise ValueError(msg)
+        except ValueError as e:
+            data = SystemTools.serialize_exception(e)
+        assert data.message == ["ValueError: nope\n"]
+        assert data.stacktrace[0].name == "test_serialize_exception"
+
 
 if __name__ == "__main__":
     pytest.main()